@@ -0,0 +1,141 @@
+"""Tarjan strongly-connected-components kernel over a CSR adjacency."""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional. Without it, callers should use tarjan_scc_sets:
+    # plain-Python indexing of numpy arrays is slower than walking sets
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def tarjan_scc(out_indptr, out_indices, roots):
+    """Labels every node reachable from `roots` with its component id.
+
+    The out-neighbours of node i are out_indices[out_indptr[i]:out_indptr[i + 1]].
+    Component ids are numbered in the order Tarjan completes them; nodes
+    that were not reached keep -1. The DFS uses explicit stacks, so graph
+    depth is not limited by recursion.
+    """
+    n = out_indptr.shape[0] - 1
+    index = np.full(n, -1, dtype=np.int32)
+    lowlink = np.zeros(n, dtype=np.int32)
+    on_stack = np.zeros(n, dtype=np.bool_)
+    stack = np.empty(n, dtype=np.int32)
+    call_node = np.empty(n, dtype=np.int32)
+    call_pos = np.empty(n, dtype=np.int32)
+    comp_id = np.full(n, -1, dtype=np.int32)
+    counter = 0
+    n_components = 0
+    sp = 0
+
+    for root in roots:
+        if index[root] != -1:
+            continue
+        index[root] = counter
+        lowlink[root] = counter
+        counter += 1
+        stack[sp] = root
+        sp += 1
+        on_stack[root] = True
+        call_node[0] = root
+        call_pos[0] = out_indptr[root]
+        depth = 1
+
+        while depth > 0:
+            node = call_node[depth - 1]
+            pos = call_pos[depth - 1]
+            if pos < out_indptr[node + 1]:
+                child = out_indices[pos]
+                call_pos[depth - 1] = pos + 1
+                if index[child] == -1:
+                    # Descend into an unvisited child; resume this node later
+                    index[child] = counter
+                    lowlink[child] = counter
+                    counter += 1
+                    stack[sp] = child
+                    sp += 1
+                    on_stack[child] = True
+                    call_node[depth] = child
+                    call_pos[depth] = out_indptr[child]
+                    depth += 1
+                elif on_stack[child] and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            else:
+                depth -= 1
+                if depth > 0:
+                    parent = call_node[depth - 1]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    while True:
+                        sp -= 1
+                        member = stack[sp]
+                        on_stack[member] = False
+                        comp_id[member] = n_components
+                        if member == node:
+                            break
+                    n_components += 1
+
+    return comp_id
+
+
+def tarjan_scc_sets(out_adj, roots):
+    """Pure-Python counterpart of tarjan_scc over a list of out-neighbour sets.
+
+    Returns the same component id list (-1 for nodes not reached from `roots`).
+    """
+    n = len(out_adj)
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    stack = []
+    comp_id = [-1] * n
+    counter = 0
+    n_components = 0
+
+    for root in roots:
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(out_adj[root]))]
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if index[child] == -1:
+                    # Descend into an unvisited child; resume this node later
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(out_adj[child])))
+                    break
+                if on_stack[child] and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        comp_id[member] = n_components
+                        if member == node:
+                            break
+                    n_components += 1
+
+    return comp_id
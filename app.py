@@ -1,78 +1,326 @@
+from collections import defaultdict
+import queue
+import threading
+
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from _scc_kernel import HAVE_NUMBA, tarjan_scc, tarjan_scc_sets
+
+# Node types
+PROCESS, RESOURCE = 0, 1
+# Edge types
+REQUEST, ALLOCATION = 0, 1
+
 class ResourceAllocationGraph:
+    # Drawing colours, indexed by node_type / edge_type
+    _NODE_COLOR = ("lightblue", "lightgreen")
+    _EDGE_COLOR = ("red", "green")
+
+    __slots__ = ("n", "node_id", "node_label", "node_type", "instances", "allocated",
+                 "out_adj", "in_adj", "edge_type", "_n_requests", "_dirty", "_touched",
+                 "_pos", "_csr", "_lock")
+
     def __init__(self):
-        self.graph = nx.DiGraph()
+        # Nodes are interned to integer ids; per-node data lives in parallel
+        # arrays indexed by that id. The numpy arrays are over-allocated and
+        # only the first n slots are live. node_type is PROCESS or RESOURCE;
+        # edge_type is REQUEST (process -> resource) or ALLOCATION
+        # (resource -> process).
+        self.n = 0
+        self.node_id = {}
+        self.node_label = []
+        self.node_type = np.zeros(8, dtype=np.int8)
+        self.instances = np.zeros(8, dtype=np.int32)
+        self.allocated = np.zeros(8, dtype=np.int32)
+        self.out_adj = []
+        self.in_adj = []
+        self.edge_type = {}
+        # Number of request edges, so detect_deadlock can bail out early
+        self._n_requests = 0
+        # Set whenever an edge changes; _touched holds the endpoints changed
+        # since the last deadlock-free scan (see detect_new_deadlock)
+        self._dirty = True
+        self._touched = set()
+        # Cached spring layout for visualize_graph and CSR adjacency for the
+        # SCC kernel, both dropped on any change
+        self._pos = None
+        self._csr = None
+        # Guards the arrays above against the background deadlock scan
+        self._lock = threading.Lock()
+
+    def _add_node(self, label, node_type, instances=0):
+        self._pos = None
+        self._csr = None
+        n = self.n
+        if n == len(self.node_type):
+            # Out of capacity: double every per-node array
+            self.node_type = np.concatenate((self.node_type, np.zeros_like(self.node_type)))
+            self.instances = np.concatenate((self.instances, np.zeros_like(self.instances)))
+            self.allocated = np.concatenate((self.allocated, np.zeros_like(self.allocated)))
+        self.node_id[label] = n
+        self.node_label.append(label)
+        self.node_type[n] = node_type
+        self.instances[n] = instances
+        self.n = n + 1
+        self.out_adj.append(set())
+        self.in_adj.append(set())
+
+    def _edge_changed(self, u, v):
+        """Marks the graph dirty and drops the cached layout and CSR after u -> v changed."""
+        self._dirty = True
+        self._touched.update((u, v))
+        self._pos = None
+        self._csr = None
+
+    def _remove_edge(self, u, v):
+        self._edge_changed(u, v)
+        self.out_adj[u].discard(v)
+        self.in_adj[v].discard(u)
+        if self.edge_type.pop((u, v)) == REQUEST:
+            self._n_requests -= 1
 
     def add_process(self, process):
-        if process not in self.graph.nodes:
-            self.graph.add_node(process, type="process")
-            return True
-        return False
+        with self._lock:
+            if process not in self.node_id:
+                self._add_node(process, PROCESS)
+                return True
+            return False
 
     def add_resource(self, resource, instances=1):
-        if resource not in self.graph.nodes:
-            self.graph.add_node(resource, type="resource", instances=instances, allocated=0)
-            return True
-        return False
+        with self._lock:
+            if resource not in self.node_id:
+                self._add_node(resource, RESOURCE, instances)
+                return True
+            return False
 
     def request_resource(self, process, resource):
-        if self.graph.has_node(process) and self.graph.has_node(resource):
-            if not self.graph.has_edge(process, resource):
-                self.graph.add_edge(process, resource, type="request")
+        p = self.node_id.get(process)
+        r = self.node_id.get(resource)
+        # Requests only run from a process to a resource, so the graph
+        # stays bipartite and never has a self-loop
+        if p is None or r is None or self.node_type[p] != PROCESS or self.node_type[r] != RESOURCE:
+            return False
+        with self._lock:
+            # One set.add both tests for and inserts the request edge
+            out_adj = self.out_adj[p]
+            size = len(out_adj)
+            out_adj.add(r)
+            if len(out_adj) == size:
+                return True  # Already requested
+            self._edge_changed(p, r)
+            self.in_adj[r].add(p)
+            self.edge_type[(p, r)] = REQUEST
+            self._n_requests += 1
+        return True
 
     def allocate_resource(self, process, resource):
-        if self.graph.has_edge(process, resource):
-            if self.graph.nodes[resource]['allocated'] < self.graph.nodes[resource]['instances']:
-                self.graph.remove_edge(process, resource)
-                self.graph.add_edge(resource, process, type="allocation")
-                self.graph.nodes[resource]['allocated'] += 1
-                return True
-        return False
+        p = self.node_id.get(process)
+        r = self.node_id.get(resource)
+        if p is None or r is None or r not in self.out_adj[p]:
+            return False
+        if self.allocated[r] >= self.instances[r]:
+            return False
+        # Turn the request edge p -> r around into the allocation r -> p
+        with self._lock:
+            self._edge_changed(p, r)
+            self.out_adj[p].discard(r)
+            self.in_adj[r].discard(p)
+            self.out_adj[r].add(p)
+            self.in_adj[p].add(r)
+            del self.edge_type[(p, r)]
+            self.edge_type[(r, p)] = ALLOCATION
+            self._n_requests -= 1
+            self.allocated[r] += 1
+        return True
 
     def release_resource(self, process, resource):
-        if self.graph.has_edge(resource, process):
-            self.graph.remove_edge(resource, process)
-            self.graph.nodes[resource]['allocated'] -= 1
+        p = self.node_id.get(process)
+        r = self.node_id.get(resource)
+        if p is not None and r is not None and self.edge_type.get((r, p)) == ALLOCATION:
+            with self._lock:
+                self._remove_edge(r, p)
+                self.allocated[r] -= 1
+
+    def _copy(self):
+        """Returns an independent copy of the graph state (caller holds the lock)."""
+        copy = ResourceAllocationGraph()
+        copy.n = self.n
+        copy.node_id = dict(self.node_id)
+        copy.node_label = list(self.node_label)
+        copy.node_type = self.node_type.copy()
+        copy.instances = self.instances.copy()
+        copy.allocated = self.allocated.copy()
+        copy.out_adj = [set(adj) for adj in self.out_adj]
+        copy.in_adj = [set(adj) for adj in self.in_adj]
+        copy.edge_type = dict(self.edge_type)
+        copy._n_requests = self._n_requests
+        copy._csr = self._csr
+        return copy
+
+    def to_networkx(self):
+        """Builds an nx.DiGraph view of the current state (for drawing and cycle search)."""
+        graph = nx.DiGraph()
+        labels = self.node_label
+        n = self.n
+        instances = self.instances[:n].tolist()
+        allocated = self.allocated[:n].tolist()
+        for i, node_type in enumerate(self.node_type[:n].tolist()):
+            if node_type == PROCESS:
+                graph.add_node(labels[i], type="process")
+            else:
+                graph.add_node(labels[i], type="resource", instances=instances[i], allocated=allocated[i])
+        for (u, v), edge_type in self.edge_type.items():
+            graph.add_edge(labels[u], labels[v], type="request" if edge_type == REQUEST else "allocation")
+        return graph
+
+    def _weak_component(self, nodes):
+        """Returns every node connected to `nodes` when edge direction is ignored."""
+        out_adj = self.out_adj
+        in_adj = self.in_adj
+        seen = set(nodes)
+        frontier = list(seen)
+        while frontier:
+            node = frontier.pop()
+            for neighbour in out_adj[node] | in_adj[node]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    frontier.append(neighbour)
+        return seen
+
+    def _saturated(self):
+        """Returns a per-node mask of the resources with no free instance (False for processes)."""
+        n = self.n
+        return (self.node_type[:n] == RESOURCE) & (self.allocated[:n] >= self.instances[:n])
+
+    def _blocked_adjacency(self):
+        """Returns the out-adjacency with the edges of resources that have a free instance removed.
+
+        Such a resource can always grant its next request, so it never holds
+        up a process and cannot be part of a deadlock. Leaving it out means
+        any cycle that remains consists of blocked nodes only.
+        """
+        blocked = (self.node_type[:self.n] == PROCESS) | self._saturated()
+        return [adj if is_blocked else () for adj, is_blocked in zip(self.out_adj, blocked.tolist())]
+
+    def _csr_adjacency(self):
+        """Returns the blocked out-adjacency as CSR (indptr, indices) arrays, rebuilt only after a change."""
+        if self._csr is None:
+            out_adj = self._blocked_adjacency()
+            indptr = np.zeros(self.n + 1, dtype=np.int32)
+            np.cumsum([len(adj) for adj in out_adj], out=indptr[1:])
+            indices = np.fromiter((v for adj in out_adj for v in adj), dtype=np.int32, count=indptr[-1])
+            self._csr = (indptr, indices)
+        return self._csr
+
+    def _tarjan_scc(self, roots=None):
+        """Returns each node's strongly connected component id, or -1 if not reachable from `roots`.
+
+        With no roots the whole graph is scanned. The CSR kernel is only used
+        when numba can compile it; otherwise the set-based version is faster.
+        """
+        if not HAVE_NUMBA:
+            out_adj = self._blocked_adjacency()
+            return np.array(tarjan_scc_sets(out_adj, range(self.n) if roots is None else roots), dtype=np.int32)
+        indptr, indices = self._csr_adjacency()
+        if roots is None:
+            roots = np.arange(self.n, dtype=np.int32)
+        else:
+            roots = np.fromiter(roots, dtype=np.int32)
+        return tarjan_scc(indptr, indices, roots)
+
+    def _cycle_in(self, component):
+        """Walks one cycle inside a strongly connected component, as (u, v, 'forward') edges."""
+        members = set(component)
+        path = []
+        position = {}
+        node = component[0]
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = next(v for v in self.out_adj[node] if v in members)
+        cycle = path[position[node]:]
+        labels = self.node_label
+        return [(labels[u], labels[v], 'forward') for u, v in zip(cycle, cycle[1:] + cycle[:1])]
+
+    def detect_deadlock(self, roots=None):
+        # A deadlock needs both a waiting process and a resource with no
+        # free instance; both are cheap to rule out before the SCC search
+        if self._n_requests == 0:
+            return None
+        if not np.any(self._saturated()):
+            return None
 
-    def detect_deadlock(self):
-        try:
-            # Step 1: Find any cycle
-            cycle = nx.find_cycle(self.graph, orientation='original')
-        
-            # Step 2: Validate if the cycle is a real deadlock
-            for i in range(len(cycle)):
-                u, v, _ = cycle[i]
-
-                # If it's a process requesting a resource
-                if self.graph.nodes[u]['type'] == "process" and self.graph.nodes[v]['type'] == "resource":
-                    resource = v
-                    # Check if all instances of the resource are allocated
-                    if self.graph.nodes[resource]['allocated'] < self.graph.nodes[resource]['instances']:
-                        # Not a deadlock — process can eventually get it
-                        return None
-
-            # All resources in cycle are fully allocated => real deadlock
-            return cycle
-
-        except nx.NetworkXNoCycle:
+        comp_id = self._tarjan_scc(roots)
+        visited = np.flatnonzero(comp_id >= 0)
+        components = comp_id[visited]
+        if components.size == 0:
             return None
 
+        # Resources with a free instance were left out of the search, so
+        # every component of two or more nodes is a cycle of fully allocated
+        # resources => real deadlock. A single node cannot form a cycle
+        # (request_resource only adds process -> resource edges, so there
+        # are no self-loops)
+        sizes = np.bincount(components)
+        deadlocked = np.flatnonzero(sizes >= 2)
+        if deadlocked.size == 0:
+            return None
+        return self._cycle_in(visited[components == deadlocked[0]].tolist())
+
+    def detect_new_deadlock(self):
+        """Like detect_deadlock, but only rescans the components touched since the last clean scan.
+
+        Only an edge added since then can close a new cycle, so an unchanged
+        graph is not scanned at all.
+
+        Safe to call from a background thread: the scan runs on a snapshot
+        taken under the lock, so mutators are only blocked while it is copied.
+        """
+        with self._lock:
+            if not self._dirty:
+                return None
+            touched = self._touched
+            self._dirty = False
+            self._touched = set()
+            snapshot = self._copy()
+
+        deadlock = snapshot.detect_deadlock(snapshot._weak_component(touched))
+        if deadlock is not None:
+            # Keep rescanning these nodes until the deadlock is resolved
+            with self._lock:
+                self._dirty = True
+                self._touched |= touched
+        return deadlock
 
     def visualize_graph(self):
+        graph = self.to_networkx()
         plt.figure(figsize=(8, 6))
-        pos = nx.spring_layout(self.graph)
-        node_colors = ["lightblue" if self.graph.nodes[n]["type"] == "process" else "lightgreen" for n in self.graph.nodes()]
-        labels = {node: node for node in self.graph.nodes()}
-        edges = nx.get_edge_attributes(self.graph, 'type')
-        edge_colors = ['red' if edges[edge] == 'request' else 'green' for edge in self.graph.edges()]
-        nx.draw(self.graph, pos, with_labels=True, node_color=node_colors, edge_color=edge_colors, node_size=2000)
+        # spring_layout is O(V²) per call; reuse it until the graph changes.
+        # A fixed seed keeps the layout the same for the same graph
+        if self._pos is None:
+            self._pos = nx.spring_layout(graph, seed=0)
+
+        labels = self.node_label
+        node_colors = [self._NODE_COLOR[t] for t in self.node_type[:self.n].tolist()]
+        edge_list = []
+        edge_colors = []
+        for (u, v), edge_type in self.edge_type.items():
+            edge_list.append((labels[u], labels[v]))
+            edge_colors.append(self._EDGE_COLOR[edge_type])
+
+        nx.draw(graph, self._pos, with_labels=True, nodelist=labels, edgelist=edge_list,
+                node_color=node_colors, edge_color=edge_colors, node_size=2000)
         plt.show()
 
 class ResourceGraphGUI:
+    __slots__ = ("graph", "root", "process_entry", "resource_entry", "instance_entry", "log_text",
+                 "deadlock_reported", "_deadlock_queue", "_stop_polling", "_summary_window",
+                 "_proc_tree", "_res_tree", "_res_label", "_proc_rows", "_res_rows")
+
     def __init__(self, root):
         self.graph = ResourceAllocationGraph()
         self.root = root
@@ -103,7 +351,22 @@ class ResourceGraphGUI:
         tk.Button(root, text="Show Process Table", command=self.show_summary_table).grid(row=6, column=1)
         tk.Button(root, text="Reset", command=self.reset_graph).grid(row=7, column=0, columnspan=2, pady=5)
 
-        self.check_deadlock_periodically()  # Start automatic deadlock detection
+        # Start automatic deadlock detection: a worker thread scans the graph
+        # and the Tk loop reports whatever it finds
+        self.deadlock_reported = False
+        self._deadlock_queue = queue.Queue()
+        self._stop_polling = threading.Event()
+        threading.Thread(target=self._deadlock_worker, daemon=True).start()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.after(200, self._drain_queue)
+
+        # The summary window and its tables, reused across opens
+        self._summary_window = None
+        self._proc_tree = None
+        self._res_tree = None
+        self._res_label = None
+        self._proc_rows = {}
+        self._res_rows = {}
 
     def add_process(self):
         process = self.process_entry.get().strip()
@@ -137,9 +400,11 @@ class ResourceGraphGUI:
         process = self.process_entry.get().strip()
         resource = self.resource_entry.get().strip()
         if process and resource:
-            self.graph.request_resource(process, resource)
-            messagebox.showinfo("Success", f"Process {process} requested Resource {resource}.")
-            self.update_log(f"Process '{process}' requested Resource '{resource}'.")
+            if self.graph.request_resource(process, resource):
+                messagebox.showinfo("Success", f"Process {process} requested Resource {resource}.")
+                self.update_log(f"Process '{process}' requested Resource '{resource}'.")
+            else:
+                messagebox.showerror("Error", f"{process} must be an existing process and {resource} an existing resource!")
 
     def allocate_resource(self):
         process = self.process_entry.get().strip()
@@ -160,22 +425,34 @@ class ResourceGraphGUI:
             self.update_log(f"Resource '{resource}' released from Process '{process}'.")
 
     def show_graph(self):
-        if len(self.graph.graph.nodes) == 0:
+        if len(self.graph.node_label) == 0:
             messagebox.showinfo("Info", "Graph is empty! Add processes and resources first.")
         else:
             self.graph.visualize_graph()
 
-    def check_deadlock_periodically(self):
-        """Automatically checks for deadlocks and shows a popup if detected."""
-        deadlock = self.graph.detect_deadlock()
-        if deadlock:
-            if not hasattr(self, 'deadlock_reported') or not self.deadlock_reported:
-                messagebox.showerror("Deadlock Detected!", f"Deadlock found: {deadlock}")
-                self.deadlock_reported = True
-                self.explain_deadlock_reason(deadlock)
-        else:
-            self.deadlock_reported = False  # Reset flag when no deadlock is found
-        self.root.after(5000, self.check_deadlock_periodically)
+    def _deadlock_worker(self):
+        """Checks for new deadlocks every 5 seconds (runs off the Tk thread)."""
+        while not self._stop_polling.wait(5):
+            graph = self.graph
+            self._deadlock_queue.put((graph, graph.detect_new_deadlock()))
+
+    def _drain_queue(self):
+        """Shows a popup for deadlocks reported by the worker thread."""
+        while True:
+            try:
+                graph, deadlock = self._deadlock_queue.get_nowait()
+            except queue.Empty:
+                break
+            if graph is not self.graph:
+                continue  # Result for a graph that has since been reset
+            if deadlock:
+                if not self.deadlock_reported:
+                    messagebox.showerror("Deadlock Detected!", f"Deadlock found: {deadlock}")
+                    self.deadlock_reported = True
+                    self.explain_deadlock_reason(deadlock)
+            else:
+                self.deadlock_reported = False  # Reset flag when no deadlock is found
+        self.root.after(200, self._drain_queue)
 
     def detect_deadlock(self):
         deadlock = self.graph.detect_deadlock()
@@ -186,8 +463,8 @@ class ResourceGraphGUI:
         else:
             messagebox.showinfo("No Deadlock", "No deadlock detected.")
 
-    def show_summary_table(self):
-        """Opens a new window to display the resource allocation summary table."""
+    def _build_summary_window(self):
+        """Creates the summary window and its two (empty) tables."""
         summary_window = tk.Toplevel(self.root)
         summary_window.title("Resource Allocation Summary")
         summary_window.geometry("800x500")
@@ -198,23 +475,6 @@ class ResourceGraphGUI:
         tree.heading("Requested Resources", text="Requested Resources")
         tree.heading("Status", text="Process State")
 
-        # Insert process details
-        for node in self.graph.graph.nodes():
-            if self.graph.graph.nodes[node]["type"] == "process":
-                allocated_resources = [edge[0] for edge in self.graph.graph.in_edges(node) if self.graph.graph.nodes[edge[0]]["type"] == "resource"]
-                requested_resources = [edge[1] for edge in self.graph.graph.out_edges(node) if self.graph.graph.nodes[edge[1]]["type"] == "resource"]
-                
-                # Updated process state logic
-                if requested_resources:
-                    status = "Waiting"
-                else:
-                    status = "Running"
-
-                tree.insert("", "end", values=(node, ", ".join(allocated_resources) if allocated_resources else "None",
-                                               ", ".join(requested_resources) if requested_resources else "None", status))
-
-        tree.pack(fill=tk.BOTH, expand=True)
-
         # Resource status table
         resource_label = tk.Label(summary_window, text="Resource Status", font=("Arial", 12, "bold"))
         resource_label.pack()
@@ -224,37 +484,110 @@ class ResourceGraphGUI:
         resource_tree.heading("Allocated/Total", text="Allocated/Total")
         resource_tree.heading("Status", text="Resource State")
 
-        for node in self.graph.graph.nodes():
-            if self.graph.graph.nodes[node]["type"] == "resource":
-                allocated = self.graph.graph.nodes[node]["allocated"]
-                instances = self.graph.graph.nodes[node]["instances"]
-                status = "Allocated" if allocated > 0 else "Free"
-                resource_tree.insert("", "end", values=(node, f"{allocated}/{instances}", status))
+        # The tables are packed around the label by show_summary_table
+        self._summary_window = summary_window
+        self._res_label = resource_label
+        self._proc_tree = tree
+        self._res_tree = resource_tree
+        self._proc_rows = {}
+        self._res_rows = {}
+
+    @staticmethod
+    def _update_rows(tree, shown, rows):
+        """Brings `tree` from `shown` to `rows` ({node id: values}), touching only rows that changed.
+
+        Rows use the node id as their item iid.
+        """
+        stale = [node for node in shown if node not in rows]
+        if stale:
+            tree.delete(*stale)
+        for node, values in rows.items():
+            old = shown.get(node)
+            if old is None:
+                tree.insert("", "end", iid=node, values=values)
+            elif old != values:
+                tree.item(node, values=values)
 
-        resource_tree.pack(fill=tk.BOTH, expand=True)
+    def show_summary_table(self):
+        """Opens a window to display the resource allocation summary table.
 
-    def explain_deadlock_reason(self, cycle):
-        explanation = "🔍 Deadlock Explanation:\n\n"
-        suggestion = "🛠 Suggested Action:\n\n"
+        The window is kept alive between opens; on later opens only the rows
+        that changed are updated.
+        """
+        if self._summary_window is None or not self._summary_window.winfo_exists():
+            self._build_summary_window()
+        else:
+            self._summary_window.deiconify()
+            self._summary_window.lift()
+
+        graph = self.graph
+        labels = graph.node_label
+
+        # Bucket every edge by its process in a single pass
+        alloc_by_proc = defaultdict(list)
+        req_by_proc = defaultdict(list)
+        for (u, v), edge_type in graph.edge_type.items():
+            if edge_type == ALLOCATION:
+                alloc_by_proc[v].append(labels[u])
+            else:
+                req_by_proc[u].append(labels[v])
+
+        # Collect process and resource details
+        proc_rows = {}
+        res_rows = {}
+        for node, node_type in enumerate(graph.node_type[:graph.n].tolist()):
+            if node_type == PROCESS:
+                allocated_resources = alloc_by_proc.get(node)
+                requested_resources = req_by_proc.get(node)
 
-        for i in range(len(cycle)):
-            u, v, _ = cycle[i]
-            u_type = self.graph.graph.nodes[u]['type']
-            v_type = self.graph.graph.nodes[v]['type']
+                # Updated process state logic
+                if requested_resources:
+                    status = "Waiting"
+                else:
+                    status = "Running"
+
+                proc_rows[node] = (labels[node], ", ".join(allocated_resources) if allocated_resources else "None",
+                                   ", ".join(requested_resources) if requested_resources else "None", status)
+            else:
+                allocated = graph.allocated[node]
+                instances = graph.instances[node]
+                status = "Allocated" if allocated > 0 else "Free"
+                res_rows[node] = (labels[node], f"{allocated}/{instances}", status)
+
+        # Take the tables out of the layout while their rows change, so the
+        # geometry manager runs once instead of once per row
+        proc_tree = self._proc_tree
+        res_tree = self._res_tree
+        proc_tree.pack_forget()
+        res_tree.pack_forget()
+        self._update_rows(proc_tree, self._proc_rows, proc_rows)
+        self._update_rows(res_tree, self._res_rows, res_rows)
+        self._proc_rows = proc_rows
+        self._res_rows = res_rows
+        proc_tree.pack(fill=tk.BOTH, expand=True, before=self._res_label)
+        res_tree.pack(fill=tk.BOTH, expand=True, after=self._res_label)
+        self._summary_window.update_idletasks()
 
-            if u_type == "process" and v_type == "resource":
-                explanation += f"• {u} is waiting for {v}\n"
-            elif u_type == "resource" and v_type == "process":
-                explanation += f"• {u} is held by {v}\n"
+    def explain_deadlock_reason(self, cycle):
+        node_id = self.graph.node_id
+        node_type = self.graph.node_type
+        types = {node: node_type[node_id[node]] for u, v, _ in cycle for node in (u, v)}
 
+        explanation = ["🔍 Deadlock Explanation:", ""]
         # Suggest releasing or reallocating resources
-        suggestion += "Consider releasing one of the following resource allocations:\n"
-        for i in range(len(cycle)):
-            u, v, _ = cycle[i]
-            if self.graph.graph.nodes[u]['type'] == "resource" and self.graph.graph.nodes[v]['type'] == "process":
-                suggestion += f"→ Release {u} from {v}\n"
+        suggestion = ["🛠 Suggested Action:", "", "Consider releasing one of the following resource allocations:"]
 
-        messagebox.showerror("Deadlock Details", explanation + "\n" + suggestion)
+        for u, v, _ in cycle:
+            u_type = types[u]
+            v_type = types[v]
+
+            if u_type == PROCESS and v_type == RESOURCE:
+                explanation.append(f"• {u} is waiting for {v}")
+            elif u_type == RESOURCE and v_type == PROCESS:
+                explanation.append(f"• {u} is held by {v}")
+                suggestion.append(f"→ Release {u} from {v}")
+
+        messagebox.showerror("Deadlock Details", "\n".join(explanation + [""] + suggestion))
         
     def reset_graph(self):
         confirm = messagebox.askyesno("Reset Confirmation", "Are you sure you want to reset everything?")
@@ -266,6 +599,10 @@ class ResourceGraphGUI:
             self.deadlock_reported = False
             messagebox.showinfo("Reset Done", "The simulator has been reset.")
 
+    def close(self):
+        self._stop_polling.set()
+        self.root.destroy()
+
     def update_log(self, log_message):
         """Update the log window with the new log message."""
         self.log_text.config(state=tk.NORMAL)  # Enable editing of the Text widget
@@ -0,0 +1,97 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("networkx")
+pytest.importorskip("matplotlib")
+pytest.importorskip("tkinter")
+
+from _scc_kernel import tarjan_scc, tarjan_scc_sets
+from app import ResourceAllocationGraph
+
+
+def make_deadlock():
+    """P1 holds R1 and waits for R2; P2 holds R2 and waits for R1."""
+    graph = ResourceAllocationGraph()
+    graph.add_process("P1")
+    graph.add_process("P2")
+    graph.add_resource("R1")
+    graph.add_resource("R2")
+    for process, resource in (("P1", "R1"), ("P2", "R2")):
+        graph.request_resource(process, resource)
+        assert graph.allocate_resource(process, resource)
+    graph.request_resource("P1", "R2")
+    graph.request_resource("P2", "R1")
+    return graph
+
+
+def cycle_nodes(cycle):
+    return {u for u, _, _ in cycle}
+
+
+def test_detects_two_process_deadlock():
+    assert cycle_nodes(make_deadlock().detect_deadlock()) == {"P1", "P2", "R1", "R2"}
+
+
+def test_free_resource_in_same_component_does_not_hide_deadlock():
+    # R3 has a free instance and shares a strongly connected component with
+    # the deadlock, but P2 still waits forever on R1
+    graph = make_deadlock()
+    graph.add_resource("R3", 2)
+    graph.request_resource("P1", "R3")
+    assert graph.allocate_resource("P1", "R3")
+    graph.request_resource("P2", "R3")
+    assert cycle_nodes(graph.detect_deadlock()) == {"P1", "P2", "R1", "R2"}
+
+
+def test_cycle_through_free_resource_is_not_a_deadlock():
+    graph = ResourceAllocationGraph()
+    graph.add_process("P1")
+    graph.add_process("P2")
+    graph.add_resource("R1", 2)
+    graph.add_resource("R2")
+    for process, resource in (("P1", "R1"), ("P2", "R2")):
+        graph.request_resource(process, resource)
+        assert graph.allocate_resource(process, resource)
+    graph.request_resource("P1", "R2")
+    graph.request_resource("P2", "R1")
+    assert graph.detect_deadlock() is None
+
+
+def test_releasing_breaks_deadlock():
+    graph = make_deadlock()
+    graph.release_resource("P1", "R1")
+    assert graph.detect_deadlock() is None
+
+
+def test_request_between_non_process_and_resource_is_rejected():
+    graph = make_deadlock()
+    assert not graph.request_resource("P1", "P1")
+    assert not graph.request_resource("R1", "R2")
+    assert not graph.request_resource("P1", "R9")
+    assert (graph.node_id["P1"], graph.node_id["P1"]) not in graph.edge_type
+
+
+def test_csr_and_set_kernels_agree():
+    graph = make_deadlock()
+    graph.add_process("P3")
+    graph.add_resource("R3")
+    graph.request_resource("P3", "R3")
+    assert graph.allocate_resource("P3", "R3")
+    graph.request_resource("P3", "R1")
+    indptr, indices = graph._csr_adjacency()
+    roots = np.arange(graph.n, dtype=np.int32)
+    expected = tarjan_scc_sets(graph._blocked_adjacency(), range(graph.n))
+    assert tarjan_scc(indptr, indices, roots).tolist() == expected
+
+
+@pytest.mark.parametrize("have_numba", [True, False])
+def test_both_scc_paths_find_deadlock_next_to_free_resource(monkeypatch, have_numba):
+    # The CSR kernel runs uncompiled here, but takes the same code path
+    monkeypatch.setattr("app.HAVE_NUMBA", have_numba)
+    graph = make_deadlock()
+    graph.add_resource("R3", 2)
+    graph.request_resource("P1", "R3")
+    assert graph.allocate_resource("P1", "R3")
+    graph.request_resource("P2", "R3")
+    assert cycle_nodes(graph.detect_deadlock()) == {"P1", "P2", "R1", "R2"}
+    assert cycle_nodes(graph.detect_new_deadlock()) == {"P1", "P2", "R1", "R2"}